@@ -54,6 +54,7 @@ import re
 import time
 import bisect
 import operator
+from functools import lru_cache
 from datetime import tzinfo, timedelta, date, datetime, timezone
 
 
@@ -84,11 +85,9 @@ def dt_to_timestamp(dt):
     :class:`LocalTZ` object in this module, then pass the result of
     that to ``dt_to_timestamp``.
     """
-    if dt.tzinfo:
-        td = dt - EPOCH_AWARE
-    else:
-        td = dt.replace(tzinfo=timezone.utc) - EPOCH_AWARE
-    return timedelta.total_seconds(td)
+    if dt.tzinfo is not None:
+        return dt.timestamp()
+    return (dt - EPOCH_NAIVE).total_seconds()
 
 
 _NONDIGIT_RE = re.compile(r'\D')
@@ -129,7 +128,10 @@ _BOUNDS = [(0, timedelta(seconds=1), 'second'),
            (2, timedelta(days=30), 'month'),
            (1, timedelta(days=365), 'year')]
 _BOUNDS = [(b[0] * b[1], b[1], b[2]) for b in _BOUNDS]
-_BOUND_DELTAS = [b[0] for b in _BOUNDS]
+_BOUND_DELTA_SECS = [b[0].total_seconds() for b in _BOUNDS]
+# all time units cardinalize normally, no need for strutils
+_BOUND_PLURALS = [b[2] + 's' for b in _BOUNDS]
+_BOUND_UNIT_SECS = [b[1].total_seconds() for b in _BOUNDS]
 
 _FLOAT_PATTERN = r'[+-]?\ *(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?'
 _PARSE_TD_RE = re.compile(r"((?P<value>%s)\s*(?P<unit>\w)\w*)" % _FLOAT_PATTERN)
@@ -137,6 +139,40 @@ _PARSE_TD_KW_MAP = {unit[0]: unit + 's'
                          for _, _, unit in reversed(_BOUNDS[:-2])}
 
 
+def _parse_td_fast(text):
+    # handles the common "<number><unit>" and "<number> <unit>" forms
+    # (e.g., "1d 2h" and "2 weeks 1 day") without the regex. returns
+    # None on anything unusual, so that parse_timedelta can fall back
+    # to _PARSE_TD_RE (and its errors).
+    if not isinstance(text, str):
+        return None
+    tokens = text.split()
+    td_kwargs = {}
+    i, n_tokens = 0, len(tokens)
+    while i < n_tokens:
+        token = tokens[i]
+        unit = token.lstrip('+-.0123456789')
+        if unit:
+            value = token[:len(token) - len(unit)]
+            i += 1
+        elif i + 1 < n_tokens:
+            value, unit = token, tokens[i + 1]
+            i += 2
+        else:
+            return None
+        if not value:
+            return None
+        digits = value[1:] if value[0] in '+-' else value
+        if not digits.replace('.', '', 1).isdecimal() or not unit.isalpha():
+            return None
+        unit_key = _PARSE_TD_KW_MAP.get(unit[0])
+        if unit_key is None:
+            return None
+        td_kwargs[unit_key] = float(value)
+    return td_kwargs
+
+
+@lru_cache(maxsize=1024)
 def parse_timedelta(text):
     """Robustly parses a short text description of a time period into a
     :class:`datetime.timedelta`. Supports weeks, days, hours, minutes,
@@ -161,7 +197,13 @@ def parse_timedelta(text):
 
     >>> parse_td('-1.5 weeks 3m 20s') == timedelta(days=-11, seconds=43400)
     True
+
+    Results are cached by *text*, as the same few strings tend to be
+    parsed over and over (e.g., from configuration).
     """
+    td_kwargs = _parse_td_fast(text)
+    if td_kwargs is not None:
+        return timedelta(**td_kwargs)
     td_kwargs = {}
     for match in _PARSE_TD_RE.finditer(text):
         value, unit = match.group('value'), match.group('unit')
@@ -182,14 +224,6 @@ def parse_timedelta(text):
 parse_td = parse_timedelta  # legacy alias
 
 
-def _cardinalize_time_unit(unit, value):
-    # removes dependency on strutils; nice and simple because
-    # all time units cardinalize normally
-    if value == 1:
-        return unit
-    return unit + 's'
-
-
 def decimal_relative_time(d, other=None, ndigits=0, cardinalize=True):
     """Get a tuple representing the relative time difference between two
     :class:`~datetime.datetime` objects or one
@@ -225,14 +259,17 @@ def decimal_relative_time(d, other=None, ndigits=0, cardinalize=True):
     if other is None:
         other = datetime.now(timezone.utc).replace(tzinfo=None)
     diff = other - d
-    diff_seconds = timedelta.total_seconds(diff)
-    abs_diff = abs(diff)
-    b_idx = bisect.bisect(_BOUND_DELTAS, abs_diff) - 1
-    bbound, bunit, bname = _BOUNDS[b_idx]
-    f_diff = diff_seconds / timedelta.total_seconds(bunit)
-    rounded_diff = round(f_diff, ndigits)
-    if cardinalize:
-        return rounded_diff, _cardinalize_time_unit(bname, abs(rounded_diff))
+    diff_seconds = diff.total_seconds()
+    b_idx = bisect.bisect(_BOUND_DELTA_SECS, abs(diff_seconds)) - 1
+    bname = _BOUNDS[b_idx][2]
+    f_diff = diff_seconds / _BOUND_UNIT_SECS[b_idx]
+    if ndigits == 0:
+        # round() is much faster without ndigits; float() keeps the type
+        rounded_diff = float(round(f_diff))
+    else:
+        rounded_diff = round(f_diff, ndigits)
+    if cardinalize and rounded_diff != 1 and rounded_diff != -1:
+        return rounded_diff, _BOUND_PLURALS[b_idx]
     return rounded_diff, bname
 
 
@@ -424,6 +461,7 @@ class ConstantTZInfo(tzinfo):
 
 UTC = ConstantTZInfo('UTC')
 EPOCH_AWARE = datetime.fromtimestamp(0, UTC)
+EPOCH_NAIVE = datetime(1970, 1, 1)
 
 
 class LocalTZInfo(tzinfo):
@@ -446,6 +484,11 @@ class LocalTZInfo(tzinfo):
     if time.daylight:
         _dst_offset = timedelta(seconds=-time.altzone)
 
+    def _has_dst(self):
+        # when False, is_dst() can't change any answer below. checked
+        # on every call, as time.tzset() can change the local zone.
+        return bool(time.daylight) or time.tzname[0] != time.tzname[1]
+
     def is_dst(self, dt):
         dt_t = (dt.year, dt.month, dt.day, dt.hour, dt.minute,
                 dt.second, dt.weekday(), 0, -1)
@@ -453,16 +496,22 @@ class LocalTZInfo(tzinfo):
         return local_t.tm_isdst > 0
 
     def utcoffset(self, dt):
+        if not self._has_dst():
+            return self._std_offset
         if self.is_dst(dt):
             return self._dst_offset
         return self._std_offset
 
     def dst(self, dt):
+        if not self._has_dst():
+            return ZERO
         if self.is_dst(dt):
             return self._dst_offset - self._std_offset
         return ZERO
 
     def tzname(self, dt):
+        if not self._has_dst():
+            return time.tzname[0]
         return time.tzname[self.is_dst(dt)]
 
     def __repr__(self):
@@ -505,6 +554,24 @@ DSTSTART_1967_1986 = datetime(1, 4, 24, 2)
 DSTEND_1967_1986 = DSTEND_1987_2006
 
 
+@lru_cache(maxsize=128)
+def _us_dst_window(year):
+    # Find start and end times for US DST. For years before 1967, return
+    # None for no DST. Only depends on the year, hence the cache.
+    if 2006 < year:
+        dststart, dstend = DSTSTART_2007, DSTEND_2007
+    elif 1986 < year < 2007:
+        dststart, dstend = DSTSTART_1987_2006, DSTEND_1987_2006
+    elif 1966 < year < 1987:
+        dststart, dstend = DSTSTART_1967_1986, DSTEND_1967_1986
+    else:
+        return None
+
+    start = _first_sunday_on_or_after(dststart.replace(year=year))
+    end = _first_sunday_on_or_after(dstend.replace(year=year))
+    return start, end
+
+
 class USTimeZone(tzinfo):
     """Copied directly from the Python docs, the ``USTimeZone`` is a
     :class:`datetime.tzinfo` subtype used to create the
@@ -517,6 +584,10 @@ class USTimeZone(tzinfo):
         self.stdname = stdname
         self.dstname = dstname
 
+    def __getinitargs__(self):
+        return (self.stdoffset / HOUR, self.reprname,
+                self.stdname, self.dstname)
+
     def __repr__(self):
         return self.reprname
 
@@ -538,19 +609,10 @@ class USTimeZone(tzinfo):
             return ZERO
         assert dt.tzinfo is self
 
-        # Find start and end times for US DST. For years before 1967, return
-        # ZERO for no DST.
-        if 2006 < dt.year:
-            dststart, dstend = DSTSTART_2007, DSTEND_2007
-        elif 1986 < dt.year < 2007:
-            dststart, dstend = DSTSTART_1987_2006, DSTEND_1987_2006
-        elif 1966 < dt.year < 1987:
-            dststart, dstend = DSTSTART_1967_1986, DSTEND_1967_1986
-        else:
+        window = _us_dst_window(dt.year)
+        if window is None:
             return ZERO
-
-        start = _first_sunday_on_or_after(dststart.replace(year=dt.year))
-        end = _first_sunday_on_or_after(dstend.replace(year=dt.year))
+        start, end = window
 
         # Can't compare naive to aware objects, so strip the timezone
         # from dt first.
@@ -1,8 +1,14 @@
-from datetime import timedelta, date
+import pickle
+import time
+import weakref
+from datetime import timedelta, date, datetime
 
 import pytest
 
-from boltons.timeutils import daterange
+from boltons.timeutils import (daterange, isoparse, parse_timedelta,
+                               decimal_relative_time, dt_to_timestamp,
+                               ConstantTZInfo, Eastern,
+                               LocalTZ, UTC, ZERO, HOUR)
 
 
 def test_daterange_years():
@@ -56,3 +62,201 @@ def test_daterange_with_same_start_stop():
     assert next(date_range_inclusive) == today
     with pytest.raises(StopIteration):
         next(date_range_inclusive)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('', timedelta()),
+    ('1 d 2 h 3 m 4 s', timedelta(days=1, seconds=7384)),
+    ('2 weeks 1 day', timedelta(days=15)),
+    ('-1.5 weeks 3 m 20 s', timedelta(days=-11, seconds=43400)),
+    ('.5 hours +1. minute', timedelta(seconds=1860)),
+    ('1d 2h 3.5m 0s', timedelta(days=1, seconds=7410)),
+    ('1d 2 hours -.5m', timedelta(days=1, seconds=7170)),
+    ('1.d', timedelta(days=1)),
+    ('5m30s', timedelta(minutes=5)),
+    ('days 1d', timedelta(days=1)),
+    ('1d 2', timedelta(days=1)),
+    ('2 weeks, 1 day', timedelta(days=15)),
+    ('1e1 seconds', timedelta(seconds=10)),
+])
+def test_parse_timedelta(text, expected):
+    assert parse_timedelta(text) == expected
+
+
+@pytest.mark.parametrize('text', ['1 x', '1 M', '2 days 3 years', '1d 3y'])
+def test_parse_timedelta_invalid_unit(text):
+    with pytest.raises(ValueError):
+        parse_timedelta(text)
+
+
+@pytest.mark.parametrize('text', [None, 5, b'1d'])
+def test_parse_timedelta_non_str(text):
+    with pytest.raises(TypeError):
+        parse_timedelta(text)
+
+
+def test_parse_timedelta_cached():
+    assert parse_timedelta('30s') is parse_timedelta('30s')
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parse_timedelta('30x')
+
+
+def test_decimal_relative_time_cardinalize():
+    now = datetime(2020, 1, 1)
+    day = timedelta(days=1)
+    assert decimal_relative_time(now - day, now) == (1, 'day')
+    assert decimal_relative_time(now + day, now) == (-1, 'day')
+    assert decimal_relative_time(now - 2 * day, now) == (2, 'days')
+    assert decimal_relative_time(now - 2 * day, now,
+                                 cardinalize=False) == (2, 'day')
+    assert decimal_relative_time(now, now) == (0, 'seconds')
+
+
+def test_decimal_relative_time_bounds():
+    now = datetime(2020, 1, 1)
+    ago = lambda **kw: decimal_relative_time(now - timedelta(**kw), now)[1]
+    assert ago(seconds=59, microseconds=999999) == 'seconds'
+    assert ago(seconds=60) == 'minute'
+    assert ago(days=59) == 'weeks'
+    assert ago(days=60) == 'months'
+    assert ago(days=365) == 'year'
+    assert decimal_relative_time(now, now - timedelta(days=60))[1] == 'months'
+
+
+def test_decimal_relative_time_rounding():
+    now = datetime(2020, 1, 1)
+    drt, unit = decimal_relative_time(now - timedelta(hours=36), now)
+    assert (drt, unit) == (2.0, 'days')
+    assert type(drt) is float
+    drt, unit = decimal_relative_time(now - timedelta(hours=36), now, ndigits=1)
+    assert (drt, unit) == (1.5, 'days')
+
+
+def test_us_timezone_dst():
+    def est(*a):
+        return datetime(*a, tzinfo=Eastern)
+
+    assert est(2020, 3, 8, 1, 59).dst() == ZERO
+    assert est(2020, 3, 8, 2).dst() == HOUR
+    assert est(2020, 11, 1, 0, 59).dst() == HOUR
+    assert est(2020, 11, 1, 1).dst() == ZERO
+    assert est(2000, 4, 2, 2).dst() == HOUR
+    assert est(1980, 4, 27, 2).dst() == HOUR
+    assert est(1960, 7, 1).dst() == ZERO
+    assert est(2020, 7, 1).tzname() == 'EDT'
+    assert est(2020, 1, 1).utcoffset() == timedelta(hours=-5)
+
+
+def test_local_tz_is_dst():
+    start = datetime(2020, 1, 1, 0, 30)
+    for hours in range(0, 366 * 24, 7):
+        dt = start + timedelta(hours=hours)
+        dt_t = (dt.year, dt.month, dt.day, dt.hour, dt.minute,
+                dt.second, dt.weekday(), 0, -1)
+        expected = time.localtime(time.mktime(dt_t)).tm_isdst > 0
+        assert LocalTZ.is_dst(dt) == expected
+
+
+@pytest.fixture
+def local_tz(monkeypatch):
+    if not hasattr(time, 'tzset'):
+        pytest.skip('time.tzset() required')
+
+    def set_tz(name):
+        monkeypatch.setenv('TZ', name)
+        time.tzset()
+
+    yield set_tz
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize('tz_name, day', [
+    ('Pacific/Chatham', date(1990, 3, 18)),  # switches at 02:45
+    ('America/St_Johns', date(1990, 4, 1)),  # switches at 00:01
+    ('America/St_Johns', date(1990, 10, 28)),
+    ('America/Sao_Paulo', date(1990, 1, 15)),  # no DST today, but in 1990
+])
+def test_local_tz_is_dst_off_the_hour(local_tz, tz_name, day):
+    local_tz(tz_name)
+    start = datetime(day.year, day.month, day.day)
+    for minutes in range(24 * 60):
+        dt = start + timedelta(minutes=minutes)
+        dt_t = (dt.year, dt.month, dt.day, dt.hour, dt.minute,
+                dt.second, dt.weekday(), 0, -1)
+        expected = time.localtime(time.mktime(dt_t)).tm_isdst > 0
+        assert LocalTZ.is_dst(dt) == expected, dt
+
+
+def test_local_tz_follows_tzset(local_tz):
+    summer = datetime(2020, 7, 1, 12)
+    local_tz('America/New_York')
+    assert LocalTZ.is_dst(summer)
+    local_tz('UTC')
+    assert not LocalTZ.is_dst(summer)
+
+
+def test_local_tz_tzname_follows_tzset(local_tz):
+    summer, winter = datetime(2020, 7, 1, 12), datetime(2020, 1, 1, 12)
+    local_tz('UTC')
+    assert LocalTZ.tzname(summer) == 'UTC'
+    local_tz('America/New_York')
+    assert LocalTZ.tzname(summer) == 'EDT'
+    assert LocalTZ.tzname(winter) == 'EST'
+
+
+def test_dt_to_timestamp():
+    naive = datetime(2021, 6, 1, 12, 30, 15, 250000)
+    expected = 1622550615.25
+    assert dt_to_timestamp(naive) == expected
+    assert dt_to_timestamp(naive.replace(tzinfo=UTC)) == expected
+    assert dt_to_timestamp(naive.replace(tzinfo=Eastern)) == expected + 4 * 3600
+    assert dt_to_timestamp(datetime(1960, 1, 1)) == -315619200.0
+
+
+def test_tzinfo_pickle():
+    tz = pickle.loads(pickle.dumps(ConstantTZInfo('CET', HOUR)))
+    assert (tz.name, tz.offset) == ('CET', HOUR)
+
+    eastern = pickle.loads(pickle.dumps(Eastern))
+    assert repr(eastern) == 'Eastern'
+    assert eastern.stdoffset == timedelta(hours=-5)
+    assert datetime(2020, 7, 1, tzinfo=eastern).tzname() == 'EDT'
+
+
+# pickle.dumps([datetime(2020, 1, 1, tzinfo=UTC), ConstantTZInfo('CET', HOUR)],
+#              protocol=2), as made by earlier releases
+_OLD_TZ_PICKLE = (
+    b'\x80\x02]q\x00(cdatetime\ndatetime\nq\x01c_codecs\nencode\nq\x02X\x0b'
+    b'\x00\x00\x00\x07\xc3\xa4\x01\x01\x00\x00\x00\x00\x00\x00q\x03X\x06\x00'
+    b'\x00\x00latin1q\x04\x86q\x05Rq\x06cboltons.timeutils\nConstantTZInfo\n'
+    b'q\x07)Rq\x08}q\t(X\x04\x00\x00\x00nameq\nX\x03\x00\x00\x00UTCq\x0bX\x06'
+    b'\x00\x00\x00offsetq\x0ccdatetime\ntimedelta\nq\rK\x00K\x00K\x00\x87q\x0e'
+    b'Rq\x0fub\x86q\x10Rq\x11h\x07)Rq\x12}q\x13(h\nX\x03\x00\x00\x00CETq\x14h'
+    b'\x0ch\rK\x00M\x10\x0eK\x00\x87q\x15Rq\x16ube.')
+
+
+class _ZonedTZInfo(ConstantTZInfo):
+    def __init__(self, name='ZonedTZ', offset=ZERO, zone=None):
+        super().__init__(name, offset)
+        self.zone = zone
+
+
+def test_tzinfo_attributes():
+    assert weakref.ref(UTC)() is UTC
+    assert weakref.ref(Eastern)() is Eastern
+
+    tz = pickle.loads(pickle.dumps(_ZonedTZInfo('CET', HOUR, 'Europe/Paris')))
+    assert (tz.name, tz.offset, tz.zone) == ('CET', HOUR, 'Europe/Paris')
+
+
+def test_tzinfo_unpickle_old():
+    utc_dt, cet = pickle.loads(_OLD_TZ_PICKLE)
+    assert utc_dt == datetime(2020, 1, 1, tzinfo=UTC)
+    assert utc_dt.tzname() == 'UTC'
+    assert (cet.name, cet.offset) == ('CET', HOUR)
+
+
+def test_isoparse_unicode_digits():
+    assert isoparse('\uff12\uff10\uff12\uff10-01-01T00:00:00') == datetime(2020, 1, 1)